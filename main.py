@@ -1,27 +1,71 @@
 import csv
-import networkx as nx
-import plotly.graph_objects as go
-from dash import Dash, dcc, html, Input, Output, ctx
-from itertools import cycle
+import re
+import sys
+from dash import Dash, dcc, html, Input, Output, State, Patch, ctx, no_update
+from collections import defaultdict
+from dataclasses import dataclass
+from importlib.util import find_spec
+from operator import itemgetter
 
 
-def generate_colors():
-    """Generate a cycle of colors for dynamically assigning group colors."""
-    colors = [
-        "blue", "red", "green", "yellow", "purple", "orange",
-        "cyan", "magenta", "lime", "pink", "teal", "brown"
-    ]
-    return cycle(colors)
+GROUP_COLORS = (
+    "blue", "red", "green", "yellow", "purple", "orange",
+    "cyan", "magenta", "lime", "pink", "teal", "brown"
+)
+
+
+# Trace order in the figure; Patch updates address traces by these indices
+SATISFIED_EDGES, UNSATISFIED_EDGES, NODES = range(3)
+
+
+def _column_getter(reader, *columns):
+    """Consume the header row and return an itemgetter for the named columns.
 
+    An empty file has no header and no rows, so None is returned; the caller's
+    row loop never runs and never calls it.
+    """
+    header = next(reader, None)
+    if header is None:
+        return None
+    header = [name.strip() for name in header]
+    return itemgetter(*(header.index(column) for column in columns))
 
+
+@dataclass(slots=True, eq=False)
 class Course:
-    def __init__(self, class_number, name, group, credits, completed):
-        self.class_number = class_number
-        self.name = name
-        self.group = group
-        self.credits = int(credits)
-        self.completed = completed.lower() == "true"
-        self.prerequisites = []
+    class_number: str
+    name: str
+    group: str
+    credits: int
+    completed: bool
+    # Index of the group in first-seen order; used instead of the name in hot lookups
+    group_id: int = 0
+    # Prerequisites are stored flat: group i is _prereq_flat[_prereq_offsets[i]:_prereq_offsets[i + 1]]
+    _prereq_flat: tuple = ()
+    _prereq_offsets: tuple = (0,)
+
+    @classmethod
+    def from_row(cls, class_number, name, group, credits, completed, group_id=0):
+        """Build a Course from raw CSV cells, converting credits and the completed flag."""
+        return cls(class_number, name, group, int(credits), completed.lower() == "true", group_id)
+
+    @property
+    def prerequisites(self):
+        """Read-only view: a tuple of AND groups, each a tuple of OR alternatives."""
+        return tuple(self.prereq_groups())
+
+    def prereq_groups(self):
+        """Yield each AND group of prerequisites as a tuple of OR alternatives."""
+        flat = self._prereq_flat
+        offsets = self._prereq_offsets
+        for start, end in zip(offsets, offsets[1:]):
+            yield flat[start:end]
+
+    def add_prerequisites(self, prereq_flat, prereq_offsets):
+        """Append prerequisite groups in the (flat, offsets) form returned by _parse_prereqs."""
+        base = len(self._prereq_flat)
+        self._prereq_flat += prereq_flat
+        self._prereq_offsets += tuple(base + offset for offset in prereq_offsets[1:])
 
     def __repr__(self):
         return f"Course({self.class_number}, {self.name}, {self.group}, {self.credits}, {self.completed}, {self.prerequisites})"
@@ -29,153 +73,273 @@ class Course:
 
 def parse_classes(file_path):
     courses = {}
-    group_colors = {}
-    color_generator = generate_colors()
+    group_ids = {}
+    strip = str.strip
+    intern = sys.intern
 
     with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            class_number = row["Class Number:"].strip()
-            name = row["Class Name:"].strip()
-            group = row["Group:"].strip()
-            credits = row["Credits:"].strip()
-            completed = row["Completed:"].strip()
+        reader = csv.reader(csvfile)
+        fields = _column_getter(reader, "Class Number:", "Class Name:", "Group:", "Credits:", "Completed:")
+        for row in filter(None, reader):
+            class_number, name, group, credits, completed = fields(row)
+            class_number = intern(strip(class_number))
+            group = intern(strip(group))
 
-            if group not in group_colors:
-                group_colors[group] = next(color_generator)
+            group_id = group_ids.setdefault(group, len(group_ids))
 
-            courses[class_number] = Course(class_number, name, group, credits, completed)
+            courses[class_number] = Course.from_row(
+                class_number, strip(name), group, credits, strip(completed), group_id
+            )
 
+    # Colors follow group ids, cycling through the palette
+    group_colors = {group: GROUP_COLORS[group_id % len(GROUP_COLORS)] for group, group_id in group_ids.items()}
     return courses, group_colors
 
 
 def parse_group_credits(file_path):
     group_credits = {}
     with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            group = row["Group:"].strip()
-            credits_required = int(row["Credits Needed:"].strip())
-            group_credits[group] = credits_required
+        reader = csv.reader(csvfile)
+        fields = _column_getter(reader, "Group:", "Credits Needed:")
+        for row in filter(None, reader):
+            group, credits_required = fields(row)
+            group_credits[group.strip()] = int(credits_required)
     return group_credits
 
 
+# Matches one separator; group 1 is set for "," (new AND group) and empty for "OR"
+_PREREQ_SEPARATOR = re.compile(r"\s*(,)\s*|\s*\bOR\b\s*")
+
+
+def _parse_prereqs(s):
+    """Parse "A, B OR C" into (("A", "B", "C"), (0, 1, 3)) in a single regex scan."""
+    if "," not in s and "OR" not in s:
+        # Most rows name a single course; skip the regex for those
+        item = s.strip()
+        return ((sys.intern(item),), (0, 1)) if item else ((), (0,))
+
+    flat = []
+    offsets = [0]
+    last = 0
+    for match in _PREREQ_SEPARATOR.finditer(s):
+        item = s[last:match.start()].strip()
+        if item:
+            flat.append(sys.intern(item))
+        if match.group(1) and len(flat) > offsets[-1]:
+            offsets.append(len(flat))
+        last = match.end()
+    item = s[last:].strip()
+    if item:
+        flat.append(sys.intern(item))
+    if len(flat) > offsets[-1]:
+        offsets.append(len(flat))
+    return tuple(flat), tuple(offsets)
+
+
 def parse_prerequisites(file_path, courses):
-    with open(file_path, newline='', encoding='utf-8') as tsvfile:
-        reader = csv.DictReader(tsvfile, delimiter='\t')
-        for row in reader:
-            class_number = row["Class Number:"].strip()
-            prerequisites = row["Prerequisites:"].strip()
-            if class_number in courses:
-                prereq_groups = [
-                    [item.strip() for item in group.split("OR")]
-                    for group in prerequisites.split(",") if prerequisites
-                ]
-                courses[class_number].prerequisites.extend(prereq_groups)
-
-
-def create_figure(courses, group_colors, group_credits):
-    """Create the Plotly figure with the current state of the graph."""
-    G = nx.DiGraph()  # Create a directed graph
-    group_completed_credits = {group: 0 for group in group_credits}
-
-    # Add nodes and edges
-    for course in courses.values():
-        G.add_node(course.class_number, group=course.group, name=course.name, credits=course.credits, completed=course.completed)
-        if course.completed:
-            group_completed_credits[course.group] += course.credits
-        for prereq_group in course.prerequisites:
-            for prereq in prereq_group:
-                if prereq in courses:  # Add edge only if prerequisite exists
-                    G.add_edge(prereq, course.class_number)
-
-    # Define horizontal positions for each group
-    group_order = list(group_colors.keys())
-    group_positions = {group: i for i, group in enumerate(group_order)}
-    pos = {}
-    group_counters = {group: 0 for group in group_order}
+    parse = _parse_prereqs
+
+    # The TSV never quotes fields, so split raw lines rather than running csv's state machine
+    with open(file_path, 'rb') as tsvfile:
+        data = tsvfile.read()
+    rows = (line.split(b'\t') for line in data.splitlines() if line)
+    fields = _column_getter(rows, b"Class Number:", b"Prerequisites:")
+    for row in rows:
+        class_number, prerequisites = fields(row)
+        # Courses without prerequisites need no decoding or parsing at all
+        if not prerequisites.strip():
+            continue
+        class_number = class_number.strip().decode('utf-8')
+        if class_number in courses:
+            courses[class_number].add_prerequisites(*parse(prerequisites.decode('utf-8')))
+
+
+def load_courses(classes_file, groups_file, prereqs_file):
+    """Parse all three data files and return (courses, group_colors, group_credits)."""
+    courses, group_colors = parse_classes(classes_file)
+    group_credits = parse_group_credits(groups_file)
+    parse_prerequisites(prereqs_file, courses)
+    return courses, group_colors, group_credits
+
+
+def compute_positions(courses):
+    """Lay courses out in one column per group; depends only on the course set, not completion."""
     vertical_spacing = 3
 
-    for node in G.nodes():
-        group = G.nodes[node].get("group", "Unknown")
-        x = group_positions[group] * 5
-        y = group_counters[group] * -vertical_spacing
-        group_counters[group] += 1
-        pos[node] = (x, y)
-
-    # Create edge traces
-    satisfied_edge_x = []
-    satisfied_edge_y = []
-    unsatisfied_edge_x = []
-    unsatisfied_edge_y = []
-
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-
-        if courses[edge[0]].completed:
-            satisfied_edge_x.extend([x0, x1, None])
-            satisfied_edge_y.extend([y0, y1, None])
-        else:
-            unsatisfied_edge_x.extend([x0, x1, None])
-            unsatisfied_edge_y.extend([y0, y1, None])
-
-    satisfied_edge_trace = go.Scatter(
-        x=satisfied_edge_x,
-        y=satisfied_edge_y,
+    # Running row count per group: each course goes below the ones already in its column
+    rows = defaultdict(int)
+    pos = {}
+    for course in courses.values():
+        group_id = course.group_id
+        row = rows[group_id]
+        rows[group_id] = row + 1
+        pos[course.class_number] = (group_id * 5, row * -vertical_spacing)
+
+    return pos
+
+
+def prerequisite_edges(courses):
+    """Return the (prereq, course) edges between known courses, without duplicates."""
+    # dict.fromkeys drops repeated (prereq, course) pairs while keeping a stable order
+    known = frozenset(courses)
+    return list(dict.fromkeys(
+        (prereq, course.class_number)
+        for course in courses.values()
+        for prereq_group in course.prereq_groups()
+        for prereq in prereq_group
+        if prereq in known  # Add edge only if prerequisite exists
+    ))
+
+
+def _edge_coordinates(starts, ends, visible):
+    """Return the [start, end, None, ...] list Plotly draws as disjoint line segments.
+
+    Every edge keeps its three slots in both edge traces; hidden edges are all None,
+    so a click can move an edge between traces by patching fixed indices.
+    """
+    coords = [None] * (3 * len(starts))
+    coords[0::3] = [start if shown else None for start, shown in zip(starts, visible)]
+    coords[1::3] = [end if shown else None for end, shown in zip(ends, visible)]
+    return coords
+
+
+def _group_label(group, completed_credits, required_credits):
+    return f"{group}<br>({completed_credits}/{required_credits} credits completed)"
+
+
+@dataclass
+class CourseTable:
+    """Per-course and per-edge columns in figure order, built once after parsing.
+
+    Everything here is fixed for the life of the app; only completion changes
+    between renders, and that is passed in as a separate column.
+    """
+    class_numbers: list
+    node_index: dict
+    hovertext: list
+    group_ids: list
+    node_colors: list
+    credits: list
+    x: list
+    y: list
+    # Group columns, indexed by group id
+    group_names: list
+    group_credits: list
+    # Edge columns, one entry per (prereq, course) edge; endpoints are node indices
+    edge_src: list
+    edge_dst: list
+    edge_x0: list
+    edge_y0: list
+    edge_x1: list
+    edge_y1: list
+    # Outgoing edges per node in CSR form: out_edges[out_indptr[i]:out_indptr[i + 1]]
+    out_indptr: list
+    out_edges: list
+
+    @classmethod
+    def from_courses(cls, courses, group_colors, group_credits, pos, edges):
+        group_color_list = list(group_colors.values())
+
+        # One pass over the courses fills every per-course column
+        node_index = {}
+        hovertext, group_ids, node_colors, credits, x, y = [], [], [], [], [], []
+        for i, course in enumerate(courses.values()):
+            class_number = course.class_number
+            group_id = course.group_id
+            node_index[class_number] = i
+            hovertext.append(f"{class_number}: {course.name} ({course.credits} credits)")
+            group_ids.append(group_id)
+            node_colors.append(group_color_list[group_id])
+            credits.append(course.credits)
+            node_x, node_y = pos[class_number]
+            x.append(node_x)
+            y.append(node_y)
+
+        edge_src = [node_index[u] for u, _ in edges]
+        edge_dst = [node_index[v] for _, v in edges]
+        out_indptr = [0] * (len(courses) + 1)
+        for src in edge_src:
+            out_indptr[src + 1] += 1
+        for i in range(len(courses)):
+            out_indptr[i + 1] += out_indptr[i]
+        return cls(
+            class_numbers=list(courses),
+            node_index=node_index,
+            hovertext=hovertext,
+            group_ids=group_ids,
+            node_colors=node_colors,
+            credits=credits,
+            x=x,
+            y=y,
+            group_names=list(group_colors),
+            group_credits=[group_credits.get(group, 0) for group in group_colors],
+            edge_src=edge_src,
+            edge_dst=edge_dst,
+            edge_x0=[x[i] for i in edge_src],
+            edge_y0=[y[i] for i in edge_src],
+            edge_x1=[x[i] for i in edge_dst],
+            edge_y1=[y[i] for i in edge_dst],
+            out_indptr=out_indptr,
+            out_edges=sorted(range(len(edge_src)), key=edge_src.__getitem__),
+        )
+
+    def outgoing(self, i):
+        """Indices of the edges leaving node i."""
+        return self.out_edges[self.out_indptr[i]:self.out_indptr[i + 1]]
+
+
+def completed_credits_by_group(table, completed):
+    """Sum completed credits per group id for a completion column in table order."""
+    totals = [0] * len(table.group_names)
+    for group_id, credits, done in zip(table.group_ids, table.credits, completed):
+        if done:
+            totals[group_id] += credits
+    return totals
+
+
+def create_figure(table, completed):
+    """Create the Plotly figure for a completion column in table order."""
+    group_completed_credits = completed_credits_by_group(table, completed)
+
+    # Create edge traces; the masks pick which trace draws each fixed segment
+    satisfied = [completed[i] for i in table.edge_src]
+    unsatisfied = [not shown for shown in satisfied]
+
+    # Traces are plain dicts: dcc.Graph takes them as-is, skipping plotly's validators
+    satisfied_edge_trace = dict(
+        type="scattergl",
+        x=_edge_coordinates(table.edge_x0, table.edge_x1, satisfied),
+        y=_edge_coordinates(table.edge_y0, table.edge_y1, satisfied),
         line=dict(width=2, color="green"),
-        hoverinfo="none",
+        hoverinfo="skip",
         mode="lines"
     )
 
-    unsatisfied_edge_trace = go.Scatter(
-        x=unsatisfied_edge_x,
-        y=unsatisfied_edge_y,
+    unsatisfied_edge_trace = dict(
+        type="scattergl",
+        x=_edge_coordinates(table.edge_x0, table.edge_x1, unsatisfied),
+        y=_edge_coordinates(table.edge_y0, table.edge_y1, unsatisfied),
         line=dict(width=2, color="red"),
-        hoverinfo="none",
+        hoverinfo="skip",
         mode="lines"
     )
 
-    # Create node traces
-    node_x = []
-    node_y = []
-    node_text = []
-    node_hovertext = []
-    node_color = []
-    node_border_color = []
-    node_size = []
-
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        group = G.nodes[node].get("group", "Unknown")
-        name = G.nodes[node].get("name", "Unknown")
-        credits = G.nodes[node].get("credits", 0)
-        completed = G.nodes[node].get("completed", False)
-
-        node_text.append(node)
-        node_hovertext.append(f"{node}: {name} ({credits} credits)")
-        node_color.append(group_colors.get(group, "gray"))
-
-        if completed:
-            node_border_color.append("gold")
-            node_size.append(30)
-        else:
-            node_border_color.append("black")
-            node_size.append(20)
-
-    node_trace = go.Scatter(
-        x=node_x,
-        y=node_y,
+    # Create the node trace from the static columns plus the completion state
+    node_size = [30 if done else 20 for done in completed]
+    node_border_color = ["gold" if done else "black" for done in completed]
+
+    node_trace = dict(
+        type="scattergl",
+        x=table.x,
+        y=table.y,
         mode="markers+text",
-        text=node_text,
-        hovertext=node_hovertext,
+        text=table.class_numbers,
+        hovertext=table.hovertext,
         hoverinfo="text",
         textposition="top center",
         marker=dict(
             size=node_size,
-            color=node_color,
+            color=table.node_colors,
             opacity=0.8,
             symbol="square",
             line=dict(width=3, color=node_border_color)
@@ -184,20 +348,19 @@ def create_figure(courses, group_colors, group_credits):
 
     group_labels = [
         dict(
-            x=group_positions[group] * 5,
+            x=group_id * 5,
             y=2,
-            text=f"{group}<br>({group_completed_credits.get(group, 0)}/{group_credits.get(group, 0)} credits completed)",
+            text=_group_label(group, group_completed_credits[group_id], table.group_credits[group_id]),
             showarrow=False,
             font=dict(size=16, color="black"),
             xanchor="center", yanchor="bottom"
-        ) for group in group_colors
+        ) for group_id, group in enumerate(table.group_names)
     ]
 
-    fig = go.Figure(
-        data=[satisfied_edge_trace, unsatisfied_edge_trace, node_trace],
-        layout=go.Layout(
-            title="Interactive Course Dependency Graph with Reset Button",
-            titlefont_size=20,
+    fig = dict(
+        data=[satisfied_edge_trace, unsatisfied_edge_trace, node_trace],  # SATISFIED_EDGES, UNSATISFIED_EDGES, NODES
+        layout=dict(
+            title=dict(text="Interactive Course Dependency Graph with Reset Button", font=dict(size=20)),
             showlegend=False,
             hovermode="closest",
             margin=dict(b=0, l=0, r=0, t=50),
@@ -211,6 +374,44 @@ def create_figure(courses, group_colors, group_credits):
     return fig
 
 
+def click_patches(table, completion, i):
+    """Return (figure patch, stored-state patch) that toggle course i's completion.
+
+    Edge e always occupies slots 3e..3e+2 of both edge traces, so moving it between
+    them only rewrites those slots; the result must match create_figure() exactly.
+    """
+    completed = not completion["completed"][i]
+
+    # Restyle only the clicked node, its outgoing edges and its group's label
+    patch = Patch()
+    nodes = patch["data"][NODES]
+    nodes["marker"]["size"][i] = 30 if completed else 20
+    nodes["marker"]["line"]["color"][i] = "gold" if completed else "black"
+
+    shown, hidden = patch["data"][SATISFIED_EDGES], patch["data"][UNSATISFIED_EDGES]
+    if not completed:
+        shown, hidden = hidden, shown
+    for e in table.outgoing(i):
+        j = 3 * e
+        shown["x"][j], shown["x"][j + 1] = table.edge_x0[e], table.edge_x1[e]
+        shown["y"][j], shown["y"][j + 1] = table.edge_y0[e], table.edge_y1[e]
+        hidden["x"][j] = hidden["x"][j + 1] = None
+        hidden["y"][j] = hidden["y"][j + 1] = None
+
+    group_id = table.group_ids[i]
+    credits = table.credits[i]
+    group_completed = completion["group_completed"][group_id] + (credits if completed else -credits)
+    patch["layout"]["annotations"][group_id]["text"] = _group_label(
+        table.group_names[group_id], group_completed, table.group_credits[group_id]
+    )
+
+    # Patch the stored state the same way instead of sending it back whole
+    stored = Patch()
+    stored["completed"][i] = completed
+    stored["group_completed"][group_id] = group_completed
+    return patch, stored
+
+
 def main():
     # File paths
     classes_file = "./mnt/data/classes.csv"
@@ -218,35 +419,50 @@ def main():
     prereqs_file = "./mnt/data/prereqs.tsv"
 
     # Parse course details and groups
-    courses, group_colors = parse_classes(classes_file)
-    group_credits = parse_group_credits(groups_file)
-    parse_prerequisites(prereqs_file, courses)
+    courses, group_colors, group_credits = load_courses(classes_file, groups_file, prereqs_file)
+
+    # Layout depends only on the course and group set, so it is computed once here
+    pos = compute_positions(courses)
+    table = CourseTable.from_courses(courses, group_colors, group_credits, pos, prerequisite_edges(courses))
 
-    original_courses = {key: course.completed for key, course in courses.items()}
+    # Completion lives in the browser (a dcc.Store), so callbacks hold no shared state
+    original_completed = [course.completed for course in courses.values()]
+    original_completion = {
+        "completed": original_completed,
+        "group_completed": completed_credits_by_group(table, original_completed),
+    }
+    # The reset state never changes, so its figure is built once and reused
+    initial_figure = create_figure(table, original_completed)
 
-    app = Dash(__name__)
+    # Gzip responses when flask-compress (dash[compress]) is installed
+    app = Dash(__name__, compress=find_spec("flask_compress") is not None)
 
     app.layout = html.Div([
-        dcc.Graph(id="course-graph", config={"displayModeBar": False}),
+        dcc.Graph(id="course-graph", figure=initial_figure, config={"displayModeBar": False}),
         html.Button("Reset", id="reset-button", n_clicks=0),
+        dcc.Store(id="completion", data=original_completion),
     ])
 
     @app.callback(
-        Output("course-graph", "figure"),
-        [Input("course-graph", "clickData"), Input("reset-button", "n_clicks")]
+        [Output("course-graph", "figure"), Output("completion", "data")],
+        [Input("course-graph", "clickData"), Input("reset-button", "n_clicks")],
+        State("completion", "data"),
+        prevent_initial_call=True
     )
-    def update_graph(click_data, reset_clicks):
+    def update_graph(click_data, reset_clicks, completion):
         triggered_id = ctx.triggered_id
         if triggered_id == "reset-button":
-            for key in courses:
-                courses[key].completed = original_courses[key]
-        elif triggered_id == "course-graph" and click_data:
-            node_id = click_data["points"][0]["text"]
-            if node_id in courses:
-                courses[node_id].completed = not courses[node_id].completed
-        return create_figure(courses, group_colors, group_credits)
-
-    app.run_server(debug=True)
+            return initial_figure, original_completion
+        if triggered_id != "course-graph" or not click_data:
+            return no_update, no_update
+        # Edge traces skip hover and clicks, but only node points carry a text label
+        i = table.node_index.get(click_data["points"][0].get("text"))
+        if i is None:
+            return no_update, no_update
+        return click_patches(table, completion, i)
+
+    # Debug mode (reloader, dev tools) is opt-in via DASH_DEBUG=true
+    app.run()
 
 
 if __name__ == "__main__":
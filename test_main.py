@@ -0,0 +1,69 @@
+import os
+import random
+import tempfile
+import unittest
+
+import main
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mnt", "data")
+
+
+def apply_patch(target, patch):
+    """Apply a Dash Patch's Assign operations to a plain dict/list in place."""
+    for operation in patch.to_plotly_json()["operations"]:
+        assert operation["operation"] == "Assign", operation
+        *path, last = operation["location"]
+        node = target
+        for key in path:
+            node = node[key]
+        node[last] = operation["params"]["value"]
+
+
+class ClickPatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        courses, group_colors, group_credits = main.load_courses(
+            os.path.join(DATA_DIR, "classes.csv"),
+            os.path.join(DATA_DIR, "groups.csv"),
+            os.path.join(DATA_DIR, "prereqs.tsv"),
+        )
+        pos = main.compute_positions(courses)
+        cls.table = main.CourseTable.from_courses(
+            courses, group_colors, group_credits, pos, main.prerequisite_edges(courses)
+        )
+        cls.completed = [course.completed for course in courses.values()]
+
+    def test_patched_figure_matches_full_render(self):
+        table = self.table
+        completed = list(self.completed)
+        completion = {
+            "completed": list(completed),
+            "group_completed": main.completed_credits_by_group(table, completed),
+        }
+        figure = main.create_figure(table, completed)
+
+        rng = random.Random(0)
+        for _ in range(300):
+            i = rng.randrange(len(completed))
+            patch, stored = main.click_patches(table, completion, i)
+            apply_patch(figure, patch)
+            apply_patch(completion, stored)
+            completed[i] = not completed[i]
+
+            self.assertEqual(figure, main.create_figure(table, completed))
+            self.assertEqual(completion["completed"], completed)
+            self.assertEqual(completion["group_completed"], main.completed_credits_by_group(table, completed))
+
+
+class EmptyFileTest(unittest.TestCase):
+    def test_empty_files_parse_to_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, name) for name in ("classes.csv", "groups.csv", "prereqs.tsv")]
+            for path in paths:
+                open(path, "w").close()
+            self.assertEqual(main.load_courses(*paths), ({}, {}, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()